@@ -11,6 +11,7 @@ Within .dialects, each dialect is free to depend on other dialects as
 required. Any dependent dialects will be loaded as needed.
 """
 
+from functools import lru_cache
 from typing import NamedTuple
 from importlib import import_module
 
@@ -55,9 +56,19 @@ def dialect_readout():
         )
 
 
-def dialect_selector(s):
-    """Return a dialect given its name."""
-    dialect = load_raw_dialect(s or "ansi")
+@lru_cache(maxsize=None)
+def _expanded_dialect(label):
+    """Load and expand a dialect, reusing the result on later calls.
+
+    Expanded dialects are not mutated after expansion, so one copy
+    can be shared between every config that selects that dialect.
+    """
+    dialect = load_raw_dialect(label)
     # Expand any callable references at this point.
     # NOTE: The result of .expand() is a new class.
     return dialect.expand()
+
+
+def dialect_selector(s):
+    """Return a dialect given its name."""
+    return _expanded_dialect(s or "ansi")
@@ -154,6 +154,10 @@ class RegexParser(StringParser):
             optional=optional,
             **segment_kwargs,
         )
+        # Compile the regexes once on creation rather than
+        # looking them up on every match attempt.
+        self._template = re.compile(self.template)
+        self._anti_template = re.compile(anti_template) if anti_template else None
 
     def simple(cls, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
@@ -174,14 +178,14 @@ class RegexParser(StringParser):
             # In any case, it won't match here.
             return False
         # Try the regex. Case sensitivity is not supported.
-        result = re.match(self.template, segment.raw_upper)
+        result = self._template.match(segment.raw_upper)
         if result:
             result_string = result.group(0)
             # Check that we've fully matched
             if result_string == segment.raw_upper:
                 # Check that the anti_template (if set) hasn't also matched
-                if self.anti_template and re.match(
-                    self.anti_template, segment.raw_upper
+                if self._anti_template and self._anti_template.match(
+                    segment.raw_upper
                 ):
                     return False
                 else:
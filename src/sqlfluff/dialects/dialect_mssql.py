@@ -5,20 +5,36 @@ https://docs.microsoft.com/en-us/sql/t-sql/language-reference?view=sql-server-ve
 
 from sqlfluff.core.dialects import load_raw_dialect
 from sqlfluff.core.parser import RegexParser, CodeSegment, BaseSegment, OneOf, Sequence, Ref, AnyNumberOf, \
-    SymbolSegment, StringParser, NamedParser, KeywordSegment
-from sqlfluff.dialects.mssql_keywords import mssql_reserved_keywords
+    SymbolSegment, StringParser, NamedParser, KeywordSegment, RegexLexer
+from sqlfluff.dialects.mssql_keywords import mssql_reserved_keywords_set
 
 # Initialize dialect
 ansi_dialect = load_raw_dialect("ansi")
 mssql_dialect = ansi_dialect.copy_as("mssql")
 
+# Lex variables as whole tokens in the single pass of the lexer, so that
+# VariableNameSegment only has to test one segment per variable.
+mssql_dialect.insert_lexer_matchers(
+    [
+        RegexLexer("variable", r"[@][a-zA-Z0-9_\.]+", CodeSegment),
+    ],
+    before="code",
+)
+
+# Compound assignment operators (e.g. +=) are lexed as single tokens
+# with one regex, rather than as a symbol followed by an equals sign.
+mssql_dialect.insert_lexer_matchers(
+    [
+        RegexLexer("compound_assignment", r"[+\-*/%&|^]=", CodeSegment),
+    ],
+    before="equals",
+)
+
 # Set key words
 mssql_dialect.sets("unreserved_keywords").difference_update(
-    [n.strip().upper() for n in mssql_reserved_keywords.split("\n")]
-)
-mssql_dialect.sets("reserved_keywords").update(
-    [n.strip().upper() for n in mssql_reserved_keywords.split("\n")]
+    mssql_reserved_keywords_set
 )
+mssql_dialect.sets("reserved_keywords").update(mssql_reserved_keywords_set)
 
 mssql_dialect.add(
     AdditionAssignmentSegment=StringParser(
@@ -55,7 +71,11 @@ mssql_dialect.add(
         Ref("BitwiseOrAssignmentSegment"),
         Ref("BitwiseXorAssignmentSegment"),
     ),
-    GoSegement=StringParser(
+    # Literals which can be used as values in DECLARE statements.
+    QuotedOrNumericLiteralGrammar=OneOf(
+        Ref("QuotedLiteralSegment"), Ref("NumericLiteralSegment")
+    ),
+    GoSegment=StringParser(
         "GO", KeywordSegment, name="execution_command", type="literal"
     ),
     DoubleQuotedLiteralSegment=NamedParser(
@@ -83,55 +103,55 @@ class DeclareStatement(BaseSegment):
 
     type = "declare_statement"
 
-    match_grammar = OneOf(
-        Sequence(
-            "DECLARE",
-            Ref("NakedIdentifierSegment"),
-            "CURSOR",
-            "FOR",
-            Ref("StatementSegment"),
-        ),
-        Sequence(
-            "DECLARE",
-            OneOf("CONTINUE", "EXIT", "UNDO"),
-            "HANDLER",
-            "FOR",
-            OneOf(
-                "SQLEXCEPTION",
-                "SQLWARNING",
-                Sequence("NOT", "FOUND"),
-                Sequence(
-                    "SQLSTATE",
-                    Ref.keyword("VALUE", optional=True),
-                    Ref("QuotedLiteralSegment"),
+    # Every form starts with DECLARE, so match it once and then choose
+    # between the forms on the tokens which follow.
+    match_grammar = Sequence(
+        "DECLARE",
+        OneOf(
+            Sequence(
+                Ref("NakedIdentifierSegment"),
+                OneOf(
+                    Sequence(
+                        "CURSOR",
+                        "FOR",
+                        Ref("StatementSegment"),
+                    ),
+                    Sequence(
+                        "CONDITION",
+                        "FOR",
+                        Ref("QuotedOrNumericLiteralGrammar"),
+                    ),
                 ),
+            ),
+            Sequence(
+                OneOf("CONTINUE", "EXIT", "UNDO"),
+                "HANDLER",
+                "FOR",
                 OneOf(
-                    Ref("QuotedLiteralSegment"),
-                    Ref("NumericLiteralSegment"),
+                    "SQLEXCEPTION",
+                    "SQLWARNING",
+                    Sequence("NOT", "FOUND"),
+                    Sequence(
+                        "SQLSTATE",
+                        Ref.keyword("VALUE", optional=True),
+                        Ref("QuotedLiteralSegment"),
+                    ),
+                    Ref("QuotedOrNumericLiteralGrammar"),
                     Ref("NakedIdentifierSegment"),
                 ),
+                Sequence(Ref("StatementSegment")),
             ),
-            Sequence(Ref("StatementSegment")),
-        ),
-        Sequence(
-            "DECLARE",
-            Ref("NakedIdentifierSegment"),
-            "CONDITION",
-            "FOR",
-            OneOf(Ref("QuotedLiteralSegment"), Ref("NumericLiteralSegment")),
-        ),
-        Sequence(
-            "DECLARE",
-            Ref("VariableNameSegment"),
-            Ref("DatatypeSegment"),
             Sequence(
-                Ref.keyword("DEFAULT"),
-                OneOf(
-                    Ref("QuotedLiteralSegment"),
-                    Ref("NumericLiteralSegment"),
-                    Ref("FunctionSegment"),
+                Ref("VariableNameSegment"),
+                Ref("DatatypeSegment"),
+                Sequence(
+                    Ref.keyword("DEFAULT"),
+                    OneOf(
+                        Ref("QuotedOrNumericLiteralGrammar"),
+                        Ref("FunctionSegment"),
+                    ),
+                    optional=True,
                 ),
-                optional=True,
             ),
         ),
     )
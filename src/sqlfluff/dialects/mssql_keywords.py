@@ -185,3 +185,8 @@ WITH
 WITHIN GROUP
 WRITETEXT
 """
+
+# Normalise the reserved keywords once, alongside the raw list.
+mssql_reserved_keywords_set = frozenset(
+    n.strip().upper() for n in mssql_reserved_keywords.splitlines() if n.strip()
+)
@@ -0,0 +1,73 @@
+"""Tests specific to the mssql dialect."""
+import pytest
+
+from sqlfluff.core.dialects import dialect_selector, load_raw_dialect
+from sqlfluff.core.parser import BaseSegment, Ref
+from sqlfluff.core.parser.context import RootParseContext
+from sqlfluff.core.parser.grammar.base import BaseGrammar
+
+TEST_DIALECT = "mssql"
+
+
+# Develop test to check specific elements against specific grammars.
+@pytest.mark.parametrize(
+    "segmentref,raw",
+    [
+        ("VariableNameSegment", "@var1"),
+        ("VariableNameSegment", "@my_table.my_field"),
+        ("AdditionAssignmentSegment", "+="),
+        ("BitwiseXorAssignmentSegment", "^="),
+        ("SetAssignmentStatementSegment", "SET @var1 = 1"),
+        ("SetAssignmentStatementSegment", "SET @var1 -= @var2"),
+        ("DeclareStatement", "DECLARE @var1 INT DEFAULT 1"),
+        ("DeclareStatement", "DECLARE my_cursor CURSOR FOR SELECT 1"),
+        ("DeclareStatement", "DECLARE my_condition CONDITION FOR '42000'"),
+        ("DeclareStatement", "DECLARE CONTINUE HANDLER FOR NOT FOUND SELECT 1"),
+        ("GoSegment", "GO"),
+        ("GoStatementSegment", "GO"),
+        ("GoStatementSegment", "GO 5"),
+    ],
+)
+def test_dialect_mssql_specific_segment_parses(
+    segmentref, raw, caplog, dialect_specific_segment_parses
+):
+    """Test mssql specific segments."""
+    dialect_specific_segment_parses(TEST_DIALECT, segmentref, raw, caplog)
+
+
+def test_dialect_mssql_go_statement_is_simple():
+    """Test GoStatementSegment can be pruned on its first token alone."""
+    dialect = dialect_selector(TEST_DIALECT)
+    with RootParseContext(dialect=dialect) as ctx:
+        assert dialect.ref("GoStatementSegment").simple(ctx) == ["GO"]
+
+
+def _iter_ref_names(elem):
+    """Yield the names of all the Refs within a grammar or segment."""
+    if isinstance(elem, Ref):
+        yield elem._get_ref()
+    elif isinstance(elem, BaseGrammar):
+        for sub_elem in elem._elements:
+            yield from _iter_ref_names(sub_elem)
+    elif isinstance(elem, type) and issubclass(elem, BaseSegment):
+        for grammar in (elem.match_grammar, elem.parse_grammar):
+            if grammar is not None:
+                yield from _iter_ref_names(grammar)
+
+
+def test_dialect_mssql_refs_resolve():
+    """Test every Ref added by the mssql dialect points at a registered element.
+
+    A misspelt name (e.g. "GoSegement") otherwise only shows up as a
+    failure when that grammar is first matched.
+    """
+    dialect = dialect_selector(TEST_DIALECT)
+    ansi_library = load_raw_dialect("ansi")._library
+    missing = {
+        name
+        for key, elem in dialect._library.items()
+        if ansi_library.get(key) is not elem
+        for name in _iter_ref_names(elem)
+        if name not in dialect._library
+    }
+    assert not missing